@@ -1,48 +1,178 @@
+import numpy as np
+import pyarrow as pa
 import streamlit as st
 
-def generate_arithmetic_sequence(first_term, common_diff, num_terms):
+from sequences import SMALL_SEQUENCE_MAX_TERMS, generate_arithmetic_sequence, generate_geometric_sequence
+
+# Static page content
+ARITHMETIC_INFO_MD = """
+An **arithmetic sequence** is a sequence of numbers where the difference between 
+consecutive terms is constant. This difference is called the **common difference**.
+
+**General Formula:** aₙ = a₁ + (n-1)d
+
+Where:
+- aₙ = the nth term
+- a₁ = the first term
+- n = the term number
+- d = the common difference
+
+**Sum Formula:** Sₙ = n/2 × (2a₁ + (n-1)d)
+
+**Examples:**
+- 2, 4, 6, 8, 10, ... (first term = 2, common difference = 2)
+- 5, 8, 11, 14, 17, ... (first term = 5, common difference = 3)
+- 10, 7, 4, 1, -2, ... (first term = 10, common difference = -3)
+"""
+
+GEOMETRIC_INFO_MD = """
+A **geometric sequence** is a sequence of numbers where each term after the first 
+is found by multiplying the previous term by a constant. This constant is called 
+the **common ratio**.
+
+**General Formula:** aₙ = a₁ × r^(n-1)
+
+Where:
+- aₙ = the nth term
+- a₁ = the first term
+- n = the term number
+- r = the common ratio
+
+**Sum Formula:** 
+- When r ≠ 1: Sₙ = a₁ × (1 - r^n) / (1 - r)
+- When r = 1: Sₙ = n × a₁
+
+**Examples:**
+- 2, 4, 8, 16, 32, ... (first term = 2, common ratio = 2)
+- 1, 3, 9, 27, 81, ... (first term = 1, common ratio = 3)
+- 100, 50, 25, 12.5, ... (first term = 100, common ratio = 0.5)
+"""
+
+LATEX_SUM_ARITH = r"S_n = \frac{n}{2} \times (2a_1 + (n-1)d)"
+LATEX_SUM_FIRST_LAST = r"S_n = \frac{n}{2} \times (a_1 + a_n)"
+LATEX_SUM_GEOM_R1 = r"S_n = n \times a_1 \quad \text{(when r = 1)}"
+LATEX_SUM_GEOM = r"S_n = a_1 \times \frac{1 - r^n}{1 - r} \quad \text{(when r ≠ 1)}"
+
+def generate_sequence(sequence_type, first_term, param_value, num_terms):
     """
-    Generate an arithmetic sequence given the first term, common difference, and number of terms.
+    Generate an arithmetic or geometric sequence.
     
     Args:
+        sequence_type (str): Either "Arithmetic" or "Geometric"
         first_term (float): The first term of the sequence
-        common_diff (float): The common difference between consecutive terms
+        param_value (float): The common difference or common ratio
         num_terms (int): The number of terms to generate
     
     Returns:
-        list: The arithmetic sequence as a list of numbers
+        numpy.ndarray: The sequence as a float64 array
     """
-    if num_terms <= 0:
-        return []
+    if sequence_type == "Arithmetic":
+        return generate_arithmetic_sequence(first_term, param_value, num_terms)
+    return generate_geometric_sequence(first_term, param_value, num_terms)
+
+@st.cache_data(show_spinner=False, max_entries=128)
+def calculate_sequence_scalars(sequence_type, first_term, param_value, num_terms):
+    """
+    Calculate the last term and the sum of a sequence from their closed-form formulas.
     
-    sequence = []
-    for i in range(num_terms):
-        term = first_term + (i * common_diff)
-        sequence.append(term)
+    For geometric sequences rⁿ is returned as well, so the step-by-step sum can
+    reuse it instead of evaluating the power again.
     
-    return sequence
+    Args:
+        sequence_type (str): Either "Arithmetic" or "Geometric"
+        first_term (float): The first term of the sequence
+        param_value (float): The common difference or common ratio
+        num_terms (int): The number of terms
+    
+    Returns:
+        dict: "last_term" (aₙ), "sum" (Sₙ) and "r_power_n" (rⁿ, None for arithmetic or r = 1)
+    """
+    if sequence_type == "Arithmetic":
+        last_term = first_term + (num_terms - 1) * param_value
+        return {
+            "last_term": last_term,
+            "sum": (num_terms / 2) * (2 * first_term + (num_terms - 1) * param_value),
+            "r_power_n": None
+        }
+    
+    if abs(param_value - 1) < 1e-10:
+        r_power_n = None
+        sequence_sum = num_terms * first_term
+    else:
+        r_power_n = param_value ** num_terms
+        sequence_sum = first_term * (1 - r_power_n) / (1 - param_value)
+    return {
+        "last_term": first_term * param_value ** (num_terms - 1),
+        "sum": sequence_sum,
+        "r_power_n": r_power_n
+    }
+
+def _format_terms(sequence):
+    """Format terms with :g as a bracketed list, eliding all but the first and last 100 past 200 terms."""
+    return np.array2string(
+        sequence,
+        separator=", ",
+        formatter={"float_kind": lambda term: f"{term:g}"},
+        threshold=200,
+        edgeitems=100,
+        max_line_width=120
+    )
 
-def generate_geometric_sequence(first_term, common_ratio, num_terms):
+def _terms_table(sequence):
+    """Wrap terms in a pyarrow.Table next to their int32 term numbers."""
+    return pa.table({
+        "Term (n)": pa.array(np.arange(1, len(sequence) + 1, dtype=np.int32)),
+        "Value (aₙ)": pa.array(sequence)
+    })
+
+@st.cache_data(show_spinner=False, max_entries=128)
+def _cached_sequence_list(sequence_type, first_term, param_value, num_terms):
+    """Memoized _format_terms for sequences too long for the generators' lru_cache."""
+    return _format_terms(generate_sequence(sequence_type, first_term, param_value, num_terms))
+
+@st.cache_data(show_spinner=False, max_entries=128)
+def _cached_sequence_table(sequence_type, first_term, param_value, num_terms):
+    """Memoized _terms_table for sequences too long for the generators' lru_cache."""
+    return _terms_table(generate_sequence(sequence_type, first_term, param_value, num_terms))
+
+def format_sequence_list(sequence_type, first_term, param_value, num_terms):
     """
-    Generate a geometric sequence given the first term, common ratio, and number of terms.
+    Format a sequence as a bracketed, comma-separated list.
+    
+    Sequences longer than 200 terms are abbreviated with an ellipsis,
+    keeping the first and last 100 terms.
     
     Args:
+        sequence_type (str): Either "Arithmetic" or "Geometric"
         first_term (float): The first term of the sequence
-        common_ratio (float): The common ratio between consecutive terms
+        param_value (float): The common difference or common ratio
         num_terms (int): The number of terms to generate
     
     Returns:
-        list: The geometric sequence as a list of numbers
+        str: The formatted sequence
     """
-    if num_terms <= 0:
-        return []
+    if num_terms <= SMALL_SEQUENCE_MAX_TERMS:
+        # Short sequences skip st.cache_data; their terms already come from an lru_cache
+        return _format_terms(generate_sequence(sequence_type, first_term, param_value, num_terms))
+    return _cached_sequence_list(sequence_type, first_term, param_value, num_terms)
+
+def build_sequence_table(sequence_type, first_term, param_value, num_terms):
+    """
+    Build a table of term numbers and values for a sequence.
     
-    sequence = []
-    for i in range(num_terms):
-        term = first_term * (common_ratio ** i)
-        sequence.append(term)
+    Args:
+        sequence_type (str): Either "Arithmetic" or "Geometric"
+        first_term (float): The first term of the sequence
+        param_value (float): The common difference or common ratio
+        num_terms (int): The number of terms to generate
     
-    return sequence
+    Returns:
+        pyarrow.Table: One row per term with its index and value
+    """
+    if num_terms <= SMALL_SEQUENCE_MAX_TERMS:
+        # Short sequences skip st.cache_data; their terms already come from an lru_cache
+        return _terms_table(generate_sequence(sequence_type, first_term, param_value, num_terms))
+    return _cached_sequence_table(sequence_type, first_term, param_value, num_terms)
 
 def main():
     # Set page title and header
@@ -115,21 +245,33 @@ def main():
                 st.error("Number of terms cannot exceed 1000.")
                 return
             
-            # Generate the sequence based on type
+            # Describe the sequence based on type
             if sequence_type == "Arithmetic":
-                sequence = generate_arithmetic_sequence(first_term, common_diff, num_terms)
                 formula_text = f"**Formula:** aₙ = {first_term} + (n-1) × {common_diff}"
                 param_name = "Common Difference"
                 param_value = common_diff
                 param_symbol = "d"
             else:  # Geometric
-                sequence = generate_geometric_sequence(first_term, common_ratio, num_terms)
                 formula_text = f"**Formula:** aₙ = {first_term} × {common_ratio}^(n-1)"
                 param_name = "Common Ratio"
                 param_value = common_ratio
                 param_symbol = "r"
             
-            if sequence:
+            # Only regenerate when an input changed since the previous run
+            signature = (sequence_type, first_term, common_diff, common_ratio, num_terms)
+            # Closed-form results shared by the metrics, the sum view and the properties panel;
+            # the terms themselves are only generated by the views that display them
+            if st.session_state.get("last_signature") != signature:
+                st.session_state["sequence_scalars"] = calculate_sequence_scalars(
+                    sequence_type, first_term, param_value, num_terms
+                )
+                st.session_state["last_signature"] = signature
+            
+            scalars = st.session_state["sequence_scalars"]
+            sum_sequence = scalars["sum"]
+            last_term = scalars["last_term"]
+            
+            if num_terms > 0:
                 st.header(f"Generated {sequence_type} Sequence")
                 
                 # Display sequence formula
@@ -145,122 +287,121 @@ def main():
                     st.metric("Number of Terms", f"{num_terms}")
                 
                 # Display the sequence in different formats
-                tab1, tab2, tab3, tab4 = st.tabs(["List View", "Table View", "Mathematical Notation", "Sum Formula (Sₙ)"])
+                # Only the selected view is rendered, unlike st.tabs which builds every tab
+                view = st.radio(
+                    "View",
+                    ["List View", "Table View", "Mathematical Notation", "Sum Formula (Sₙ)"],
+                    horizontal=True,
+                    label_visibility="collapsed"
+                )
                 
-                with tab1:
+                if view == "List View":
                     st.subheader("Sequence as List")
                     # Format the sequence nicely
-                    sequence_str = ", ".join([f"{term:g}" for term in sequence])
-                    st.code(f"[{sequence_str}]")
+                    sequence_str = format_sequence_list(sequence_type, first_term, param_value, num_terms)
+                    st.code(sequence_str)
                 
-                with tab2:
+                elif view == "Table View":
                     st.subheader("Sequence as Table")
                     # Create a table with term number and value
-                    import pandas as pd
-                    df_data = {
-                        "Term (n)": list(range(1, num_terms + 1)),
-                        "Value (aₙ)": sequence
-                    }
-                    df = pd.DataFrame(df_data)
-                    st.dataframe(df, hide_index=True, width="stretch")
+                    table = build_sequence_table(sequence_type, first_term, param_value, num_terms)
+                    st.dataframe(table, hide_index=True, width="stretch")
                 
-                with tab3:
+                elif view == "Mathematical Notation":
                     st.subheader("Mathematical Notation")
                     st.markdown("**Sequence Terms:**")
                     # Display first few terms with their calculations
                     display_limit = min(10, num_terms)
-                    for i in range(display_limit):
-                        term_value = sequence[i]
-                        if i == 0:
-                            st.markdown(f"a₁ = {first_term} = {term_value:g}")
-                        else:
-                            if sequence_type == "Arithmetic":
-                                st.markdown(f"a{i+1} = {first_term} + {i} × {param_value} = {term_value:g}")
-                            else:  # Geometric
-                                st.markdown(f"a{i+1} = {first_term} × {param_value}^{i} = {term_value:g}")
+                    if sequence_type == "Arithmetic":
+                        term_template = "a{n} = {a} + {i} × {p} = {v:g}"
+                    else:  # Geometric
+                        term_template = "a{n} = {a} × {p}^{i} = {v:g}"
+                    
+                    # Only the displayed terms are generated
+                    leading_terms = generate_sequence(sequence_type, first_term, param_value, display_limit).tolist()
+                    notation_lines = [f"a₁ = {first_term} = {leading_terms[0]:g}"]
+                    for i in range(1, display_limit):
+                        notation_lines.append(term_template.format(n=i + 1, a=first_term, i=i, p=param_value, v=leading_terms[i]))
                     
                     if num_terms > display_limit:
-                        st.markdown(f"... (showing first {display_limit} terms)")
-                        if sequence_type == "Arithmetic":
-                            st.markdown(f"a{num_terms} = {first_term} + {num_terms-1} × {param_value} = {sequence[-1]:g}")
-                        else:  # Geometric
-                            st.markdown(f"a{num_terms} = {first_term} × {param_value}^{num_terms-1} = {sequence[-1]:g}")
+                        notation_lines.append(f"... (showing first {display_limit} terms)")
+                        notation_lines.append(term_template.format(n=num_terms, a=first_term, i=num_terms - 1, p=param_value, v=last_term))
+                    
+                    st.markdown("\n\n".join(notation_lines))
                 
-                with tab4:
+                else:  # Sum Formula
                     st.subheader(f"Sum of First n Terms (Sₙ) - {sequence_type}")
                     
-                    # Calculate sum
-                    sum_sequence = sum(sequence)
-                    
                     if sequence_type == "Arithmetic":
                         # Arithmetic Series Sum
                         st.markdown("**Primary Sum Formula:**")
-                        st.latex(r"S_n = \frac{n}{2} \times (2a_1 + (n-1)d)")
+                        st.latex(LATEX_SUM_ARITH)
                         
                         # Show substitution
                         st.markdown("**Substituting our values:**")
-                        st.markdown(f"- n = {num_terms}")
-                        st.markdown(f"- a₁ = {first_term}")
-                        st.markdown(f"- d = {param_value}")
+                        st.markdown(f"- n = {num_terms}\n- a₁ = {first_term}\n- d = {param_value}")
                         
                         # Step-by-step calculation
                         st.markdown("**Step-by-step calculation:**")
-                        step1 = f"S_{num_terms} = {num_terms}/2 × (2×{first_term} + ({num_terms}-1)×{param_value})"
-                        st.markdown(f"1. {step1}")
-                        
-                        inner_calc = 2 * first_term + (num_terms - 1) * param_value
-                        step2 = f"S_{num_terms} = {num_terms}/2 × ({2 * first_term} + {(num_terms - 1) * param_value})"
-                        st.markdown(f"2. {step2}")
-                        
-                        step3 = f"S_{num_terms} = {num_terms}/2 × {inner_calc}"
-                        st.markdown(f"3. {step3}")
-                        
-                        step4 = f"S_{num_terms} = {num_terms * inner_calc / 2}"
-                        st.markdown(f"4. {step4}")
+                        two_a = 2 * first_term
+                        n_minus_1_d = (num_terms - 1) * param_value
+                        inner_calc = two_a + n_minus_1_d
+                        total = num_terms * inner_calc / 2
+                        steps_md = (
+                            f"1. S_{num_terms} = {num_terms}/2 × (2×{first_term} + ({num_terms}-1)×{param_value})\n"
+                            f"2. S_{num_terms} = {num_terms}/2 × ({two_a} + {n_minus_1_d})\n"
+                            f"3. S_{num_terms} = {num_terms}/2 × {inner_calc}\n"
+                            f"4. S_{num_terms} = {total}"
+                        )
+                        st.markdown(steps_md)
                         
                         # Alternative formula
                         st.markdown("---")
                         st.markdown("**Alternative Sum Formula (using first and last term):**")
-                        last_term = sequence[-1]
-                        st.latex(r"S_n = \frac{n}{2} \times (a_1 + a_n)")
+                        st.latex(LATEX_SUM_FIRST_LAST)
                         st.markdown(f"S_{num_terms} = {num_terms}/2 × ({first_term} + {last_term}) = {num_terms * (first_term + last_term) / 2:g}")
                         
                     else:  # Geometric
                         # Geometric Series Sum
                         st.markdown("**Primary Sum Formula:**")
                         if abs(param_value - 1) < 1e-10:  # r = 1
-                            st.latex(r"S_n = n \times a_1 \quad \text{(when r = 1)}")
+                            st.latex(LATEX_SUM_GEOM_R1)
                             st.markdown("**Step-by-step calculation:**")
                             st.markdown(f"Since r = 1, all terms are equal to a₁ = {first_term}")
                             st.markdown(f"S_{num_terms} = {num_terms} × {first_term} = {sum_sequence:g}")
                         else:  # r ≠ 1
-                            st.latex(r"S_n = a_1 \times \frac{1 - r^n}{1 - r} \quad \text{(when r ≠ 1)}")
+                            st.latex(LATEX_SUM_GEOM)
                             
                             # Show substitution
                             st.markdown("**Substituting our values:**")
-                            st.markdown(f"- n = {num_terms}")
-                            st.markdown(f"- a₁ = {first_term}")
-                            st.markdown(f"- r = {param_value}")
+                            st.markdown(f"- n = {num_terms}\n- a₁ = {first_term}\n- r = {param_value}")
                             
                             # Step-by-step calculation
                             st.markdown("**Step-by-step calculation:**")
-                            r_power_n = param_value ** num_terms
-                            step1 = f"S_{num_terms} = {first_term} × (1 - {param_value}^{num_terms}) / (1 - {param_value})"
-                            st.markdown(f"1. {step1}")
-                            
-                            step2 = f"S_{num_terms} = {first_term} × (1 - {r_power_n}) / ({1 - param_value})"
-                            st.markdown(f"2. {step2}")
-                            
+                            r_power_n = scalars["r_power_n"]
                             numerator = 1 - r_power_n
                             denominator = 1 - param_value
-                            step3 = f"S_{num_terms} = {first_term} × ({numerator}) / ({denominator})"
-                            st.markdown(f"3. {step3}")
-                            
-                            step4 = f"S_{num_terms} = {first_term * numerator / denominator}"
-                            st.markdown(f"4. {step4}")
+                            total = first_term * numerator / denominator
+                            steps_md = (
+                                f"1. S_{num_terms} = {first_term} × (1 - {param_value}^{num_terms}) / (1 - {param_value})\n"
+                                f"2. S_{num_terms} = {first_term} × (1 - {r_power_n}) / ({denominator})\n"
+                                f"3. S_{num_terms} = {first_term} × ({numerator}) / ({denominator})\n"
+                                f"4. S_{num_terms} = {total}"
+                            )
+                            st.markdown(steps_md)
                     
-                    # Final result with verification
+                    # Final result, checked against a formula that uses the last term instead
                     st.markdown("---")
+                    if sequence_type == "Arithmetic":
+                        check_sum = num_terms * (first_term + last_term) / 2
+                        check_caption = "Sₙ = n/2 × (a₁ + aₙ)"
+                    elif abs(param_value - 1) < 1e-10:
+                        check_sum = num_terms * last_term
+                        check_caption = "Sₙ = n × aₙ (when r = 1)"
+                    else:
+                        check_sum = (first_term - last_term * param_value) / (1 - param_value)
+                        check_caption = "Sₙ = (a₁ - aₙ × r)/(1-r)"
+                    
                     col_sum1, col_sum2 = st.columns(2)
                     
                     with col_sum1:
@@ -274,8 +415,8 @@ def main():
                                 st.caption("Sₙ = a₁(1-rⁿ)/(1-r)")
                     
                     with col_sum2:
-                        st.metric("Sum by Addition", f"{sum_sequence:g}")
-                        st.caption("Direct addition of all terms")
+                        st.metric("Sum using Last Term", f"{check_sum:g}")
+                        st.caption(check_caption)
                 
                 # Additional sequence properties
                 st.markdown("---")
@@ -285,23 +426,18 @@ def main():
                 
                 with prop_col1:
                     if num_terms > 1:
-                        sum_sequence = sum(sequence)
                         st.metric("Sum of Terms", f"{sum_sequence:g}")
                         
                         if sequence_type == "Arithmetic":
-                            formula_sum = (num_terms / 2) * (2 * first_term + (num_terms - 1) * param_value)
-                            st.caption(f"Formula: Sₙ = n/2 × (2a₁ + (n-1)d) = {formula_sum:g}")
+                            st.caption(f"Formula: Sₙ = n/2 × (2a₁ + (n-1)d) = {sum_sequence:g}")
                         else:  # Geometric
                             if abs(param_value - 1) < 1e-10:
-                                formula_sum = num_terms * first_term
-                                st.caption(f"Formula: Sₙ = n × a₁ = {formula_sum:g}")
+                                st.caption(f"Formula: Sₙ = n × a₁ = {sum_sequence:g}")
                             else:
-                                formula_sum = first_term * (1 - param_value ** num_terms) / (1 - param_value)
-                                st.caption(f"Formula: Sₙ = a₁(1-rⁿ)/(1-r) = {formula_sum:g}")
+                                st.caption(f"Formula: Sₙ = a₁(1-rⁿ)/(1-r) = {sum_sequence:g}")
                 
                 with prop_col2:
                     if num_terms > 0:
-                        last_term = sequence[-1]
                         st.metric("Last Term", f"{last_term:g}")
                         if sequence_type == "Arithmetic":
                             st.caption(f"Formula: aₙ = a₁ + (n-1)d")
@@ -319,50 +455,11 @@ def main():
     if sequence_type == "Arithmetic":
         st.markdown("### About Arithmetic Sequences")
         with st.expander("Learn more about arithmetic sequences"):
-            st.markdown("""
-            An **arithmetic sequence** is a sequence of numbers where the difference between 
-            consecutive terms is constant. This difference is called the **common difference**.
-            
-            **General Formula:** aₙ = a₁ + (n-1)d
-            
-            Where:
-            - aₙ = the nth term
-            - a₁ = the first term
-            - n = the term number
-            - d = the common difference
-            
-            **Sum Formula:** Sₙ = n/2 × (2a₁ + (n-1)d)
-            
-            **Examples:**
-            - 2, 4, 6, 8, 10, ... (first term = 2, common difference = 2)
-            - 5, 8, 11, 14, 17, ... (first term = 5, common difference = 3)
-            - 10, 7, 4, 1, -2, ... (first term = 10, common difference = -3)
-            """)
+            st.markdown(ARITHMETIC_INFO_MD)
     else:  # Geometric
         st.markdown("### About Geometric Sequences")
         with st.expander("Learn more about geometric sequences"):
-            st.markdown("""
-            A **geometric sequence** is a sequence of numbers where each term after the first 
-            is found by multiplying the previous term by a constant. This constant is called 
-            the **common ratio**.
-            
-            **General Formula:** aₙ = a₁ × r^(n-1)
-            
-            Where:
-            - aₙ = the nth term
-            - a₁ = the first term
-            - n = the term number
-            - r = the common ratio
-            
-            **Sum Formula:** 
-            - When r ≠ 1: Sₙ = a₁ × (1 - r^n) / (1 - r)
-            - When r = 1: Sₙ = n × a₁
-            
-            **Examples:**
-            - 2, 4, 8, 16, 32, ... (first term = 2, common ratio = 2)
-            - 1, 3, 9, 27, 81, ... (first term = 1, common ratio = 3)
-            - 100, 50, 25, 12.5, ... (first term = 100, common ratio = 0.5)
-            """)
+            st.markdown(GEOMETRIC_INFO_MD)
 
 if __name__ == "__main__":
     main()
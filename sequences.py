@@ -0,0 +1,121 @@
+from functools import lru_cache
+
+import numpy as np
+import streamlit as st
+
+try:
+    from numba import njit
+except ImportError:  # e.g. a platform without numba wheels; the NumPy implementations are used instead
+    njit = None
+
+# Below this many terms the NumPy path beats the overhead of calling compiled code
+JIT_MIN_TERMS = 64
+
+# Up to this many terms an in-process lru_cache is cheaper than st.cache_data's hashing
+SMALL_SEQUENCE_MAX_TERMS = 64
+
+if njit is not None:
+    # Explicit signatures compile eagerly at import; cache=True keeps the machine code on disk
+    _FILL_SIGNATURE = "void(float64[:], float64, float64)"
+
+    # No fastmath: the kernel must round exactly like the NumPy path used for short sequences
+    @njit(_FILL_SIGNATURE, cache=True)
+    def _fill_arithmetic(out, first_term, common_diff):
+        """Fill out with a₁ + i·d."""
+        for i in range(out.shape[0]):
+            out[i] = first_term + i * common_diff
+
+    @njit(_FILL_SIGNATURE, cache=True)
+    def _fill_geometric(out, first_term, common_ratio):
+        """Fill out with a₁·rⁱ using a running product."""
+        term = first_term
+        for i in range(out.shape[0]):
+            out[i] = term
+            term *= common_ratio
+else:
+    _fill_arithmetic = None
+    _fill_geometric = None
+
+def _arithmetic_terms(first_term, common_diff, num_terms):
+    """Compute an arithmetic sequence with numba or NumPy, without caching."""
+    if num_terms <= 0:
+        return np.empty(0, dtype=np.float64)
+    
+    if _fill_arithmetic is not None and num_terms > JIT_MIN_TERMS:
+        sequence = np.empty(num_terms, dtype=np.float64)
+        _fill_arithmetic(sequence, float(first_term), float(common_diff))
+        return sequence
+    
+    return first_term + np.arange(num_terms, dtype=np.float64) * common_diff
+
+def _geometric_terms(first_term, common_ratio, num_terms):
+    """Compute a geometric sequence with numba or NumPy, without caching."""
+    if num_terms <= 0:
+        return np.empty(0, dtype=np.float64)
+    
+    if _fill_geometric is not None and num_terms > JIT_MIN_TERMS:
+        sequence = np.empty(num_terms, dtype=np.float64)
+        _fill_geometric(sequence, float(first_term), float(common_ratio))
+        return sequence
+    
+    # Seed the buffer with [a₁, r, r, ...] and take the running product in place
+    sequence = np.empty(num_terms, dtype=np.float64)
+    sequence[0] = first_term
+    sequence[1:] = common_ratio
+    np.cumprod(sequence, out=sequence)
+    
+    return sequence
+
+@lru_cache(maxsize=256)
+def _small_arithmetic_terms(first_term, common_diff, num_terms):
+    """Memoize a short arithmetic sequence as raw bytes, which are cheap to keep and hand out."""
+    return _arithmetic_terms(first_term, common_diff, num_terms).tobytes()
+
+@lru_cache(maxsize=256)
+def _small_geometric_terms(first_term, common_ratio, num_terms):
+    """Memoize a short geometric sequence as raw bytes, which are cheap to keep and hand out."""
+    return _geometric_terms(first_term, common_ratio, num_terms).tobytes()
+
+@st.cache_data(show_spinner=False, max_entries=128)
+def _cached_arithmetic_terms(first_term, common_diff, num_terms):
+    """Memoize a long arithmetic sequence across sessions with st.cache_data."""
+    return _arithmetic_terms(first_term, common_diff, num_terms)
+
+@st.cache_data(show_spinner=False, max_entries=128)
+def _cached_geometric_terms(first_term, common_ratio, num_terms):
+    """Memoize a long geometric sequence across sessions with st.cache_data."""
+    return _geometric_terms(first_term, common_ratio, num_terms)
+
+def generate_arithmetic_sequence(first_term, common_diff, num_terms):
+    """
+    Generate an arithmetic sequence given the first term, common difference, and number of terms.
+    
+    Args:
+        first_term (float): The first term of the sequence
+        common_diff (float): The common difference between consecutive terms
+        num_terms (int): The number of terms to generate
+    
+    Returns:
+        numpy.ndarray: The arithmetic sequence as a float64 array
+    """
+    if num_terms <= SMALL_SEQUENCE_MAX_TERMS:
+        # Read-only view over the memoized bytes; callers never modify the terms
+        return np.frombuffer(_small_arithmetic_terms(first_term, common_diff, num_terms), dtype=np.float64)
+    return _cached_arithmetic_terms(first_term, common_diff, num_terms)
+
+def generate_geometric_sequence(first_term, common_ratio, num_terms):
+    """
+    Generate a geometric sequence given the first term, common ratio, and number of terms.
+    
+    Args:
+        first_term (float): The first term of the sequence
+        common_ratio (float): The common ratio between consecutive terms
+        num_terms (int): The number of terms to generate
+    
+    Returns:
+        numpy.ndarray: The geometric sequence as a float64 array
+    """
+    if num_terms <= SMALL_SEQUENCE_MAX_TERMS:
+        # Read-only view over the memoized bytes; callers never modify the terms
+        return np.frombuffer(_small_geometric_terms(first_term, common_ratio, num_terms), dtype=np.float64)
+    return _cached_geometric_terms(first_term, common_ratio, num_terms)